@@ -0,0 +1,82 @@
+"""Measure cold-start cost of the bot.
+
+Reports, as the median of several fresh interpreter runs:
+
+- ``import ai_trader``: time to import the package (should stay light).
+- ``config failure``: wall time for ``python -m ai_trader`` to exit on a
+  missing ``TELEGRAM_BOT_TOKEN``.
+- ``import monitor``: time to import ``ai_trader.services.monitor`` (the
+  heavy path with pandas and requests), for reference.
+
+Usage::
+
+    python benchmarks/startup.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def _env() -> Dict[str, str]:
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("TELEGRAM_")
+    }
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])
+    )
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def _time_command(args: List[str], runs: int) -> Tuple[float, int]:
+    samples: List[float] = []
+    returncode = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, *args],
+            env=_env(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        samples.append(time.perf_counter() - start)
+        returncode = completed.returncode
+    return statistics.median(samples), returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline, _ = _time_command(["-c", "pass"], args.runs)
+    # name -> (command, expected return code)
+    commands = {
+        "import ai_trader": (["-c", "import ai_trader"], 0),
+        "config failure": (["-m", "ai_trader"], 1),
+        "import monitor": (["-c", "import ai_trader.services.monitor"], 0),
+    }
+
+    print(f"{'interpreter':<20}{baseline * 1000:>10.1f} ms")
+    for name, (command, expected) in commands.items():
+        seconds, returncode = _time_command(command, args.runs)
+        overhead = (seconds - baseline) * 1000
+        note = "" if returncode == expected else f"  [unexpected exit {returncode}]"
+        print(f"{name:<20}{seconds * 1000:>10.1f} ms  (+{overhead:.1f} ms){note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .config import BotConfig, SymbolSettings, TimeframeSettings
-from .services.monitor import MarketMonitor
+
+if TYPE_CHECKING:
+    from .services.monitor import MarketMonitor
 
 __all__ = [
     "BotConfig",
@@ -9,3 +13,12 @@ __all__ = [
     "TimeframeSettings",
     "MarketMonitor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # MarketMonitor pulls in pandas and requests; only import it on first use.
+    if name == "MarketMonitor":
+        from .services.monitor import MarketMonitor
+
+        return MarketMonitor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
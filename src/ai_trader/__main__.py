@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
+import sys
 import time
+from typing import Optional
 
 from ai_trader.config import BotConfig
-from ai_trader.data.binance import BinanceClient
-from ai_trader.services.monitor import MarketMonitor
-from ai_trader.telegram.messenger import TelegramMessenger
+from ai_trader.data.cache import KlineCache
 
 
 def configure_logging() -> None:
@@ -20,7 +20,26 @@ def main() -> None:
     configure_logging()
     logger = logging.getLogger(__name__)
 
-    config = BotConfig.from_env()
+    # Validate configuration before importing pandas/requests so a
+    # misconfigured container fails fast.
+    try:
+        config = BotConfig.from_env()
+    except ValueError as exc:
+        logger.error("Invalid configuration: %s", exc)
+        sys.exit(1)
+
+    kline_cache: Optional[KlineCache] = None
+    if config.kline_cache_dir:
+        try:
+            kline_cache = KlineCache(config.kline_cache_dir)
+        except OSError as exc:
+            logger.error("Invalid configuration: KLINE_CACHE_DIR unusable: %s", exc)
+            sys.exit(1)
+
+    from ai_trader.data.binance import BinanceClient
+    from ai_trader.services.monitor import MarketMonitor
+    from ai_trader.telegram.messenger import TelegramMessenger
+
     data_client = BinanceClient(config.data_source_url, timeout=config.request_timeout)
     messenger = TelegramMessenger(
         token=config.telegram_token,
@@ -31,6 +50,7 @@ def main() -> None:
         config=config,
         data_client=data_client,
         messenger=messenger,
+        kline_cache=kline_cache,
     )
 
     logger.info(
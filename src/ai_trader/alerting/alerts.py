@@ -3,23 +3,23 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from ai_trader.analysis.support_resistance import PriceLevel
+from ai_trader.analysis.confluence import ConfluenceLevel
 from ai_trader.analysis.volatility import VolatilityEvent
 
 
 @dataclass
 class LevelAlert:
     symbol: str
-    timeframe: str
-    level: PriceLevel
+    level: ConfluenceLevel
     price: float
     direction: str
     triggered_at: datetime
 
     def format_message(self) -> str:
         emoji = "🛑" if self.level.kind == "resistance" else "🛡️"
+        timeframes = "/".join(self.level.timeframes)
         return (
-            f"{emoji} {self.symbol} {self.timeframe} {self.level.kind.upper()} {self.direction}\n"
+            f"{emoji} {self.symbol} {timeframes} {self.level.kind.upper()} {self.direction}\n"
             f"价格: {self.price:.2f} (关键位 {self.level.price:.2f})\n"
             f"触碰次数: {self.level.touches}"
         )
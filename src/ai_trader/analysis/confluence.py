@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from ai_trader.analysis.support_resistance import LevelKind, PriceLevel
+
+
+@dataclass
+class ConfluenceLevel:
+    """A price level merged from one or more timeframes.
+
+    ``price`` is the touch-weighted average of the members, while ``low`` and
+    ``high`` bound the member prices so alerts can fire anywhere in the zone.
+    """
+
+    price: float
+    kind: LevelKind
+    touches: int
+    last_touched: pd.Timestamp
+    low: float
+    high: float
+    timeframes: List[str] = field(default_factory=list)
+
+
+class ConfluenceAnalyzer:
+    """Merges levels from different timeframes that sit at the same price.
+
+    Each zone holds at most one level per timeframe, and every member lies
+    within ``tolerance`` of the zone's lowest price.
+    """
+
+    def __init__(self, tolerance: float = 0.003) -> None:
+        self.tolerance = tolerance
+
+    def merge(self, levels: Iterable[PriceLevel]) -> List[ConfluenceLevel]:
+        by_kind: Dict[str, List[PriceLevel]] = {}
+        order: Dict[str, int] = {}
+        for level in levels:
+            order.setdefault(level.timeframe, len(order))
+            by_kind.setdefault(level.kind, []).append(level)
+
+        merged: List[ConfluenceLevel] = []
+        for kind_levels in by_kind.values():
+            current: List[ConfluenceLevel] = []
+            for level in sorted(kind_levels, key=lambda item: item.price):
+                target = self._find_zone(current, level)
+                if target is not None:
+                    self._absorb(target, level)
+                else:
+                    current.append(self._from_level(level))
+            merged.extend(current)
+
+        for confluence in merged:
+            confluence.timeframes.sort(key=order.__getitem__)
+        return merged
+
+    def _from_level(self, level: PriceLevel) -> ConfluenceLevel:
+        return ConfluenceLevel(
+            price=level.price,
+            kind=level.kind,
+            touches=level.touches,
+            last_touched=level.last_touched,
+            low=level.price,
+            high=level.price,
+            timeframes=[level.timeframe],
+        )
+
+    def _find_zone(
+        self, zones: List[ConfluenceLevel], level: PriceLevel
+    ) -> Optional[ConfluenceLevel]:
+        # Levels arrive sorted by price, so only the most recent zones can
+        # still be within tolerance of their lowest member.
+        for zone in reversed(zones):
+            if not self._is_close(zone.low, level.price):
+                return None
+            if level.timeframe not in zone.timeframes:
+                return zone
+        return None
+
+    def _absorb(self, target: ConfluenceLevel, level: PriceLevel) -> None:
+        total = target.touches + level.touches
+        if total:
+            target.price = (
+                target.price * target.touches + level.price * level.touches
+            ) / total
+        target.touches = total
+        target.low = min(target.low, level.price)
+        target.high = max(target.high, level.price)
+        if level.last_touched > target.last_touched:
+            target.last_touched = level.last_touched
+        target.timeframes.append(level.timeframe)
+
+    def _is_close(self, reference: float, candidate: float) -> bool:
+        return abs(reference - candidate) <= reference * self.tolerance
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
 
 @dataclass
@@ -49,6 +49,7 @@ class BotConfig:
         ]
     )
     price_alert_tolerance: float = 0.002
+    confluence_tolerance: float = 0.003
     volatility_window_minutes: int = 15
     volatility_threshold: float = 0.01
     volatility_interval: str = "1m"
@@ -56,6 +57,7 @@ class BotConfig:
     data_source_url: str = "https://api.binance.com"
     request_timeout: int = 10
     poll_interval_seconds: int = 300
+    kline_cache_dir: Optional[str] = None
 
     @classmethod
     def from_env(cls) -> "BotConfig":
@@ -82,6 +84,9 @@ class BotConfig:
         price_alert_tolerance = float(
             os.getenv("PRICE_ALERT_TOLERANCE", cls.price_alert_tolerance)
         )
+        confluence_tolerance = float(
+            os.getenv("CONFLUENCE_TOLERANCE", cls.confluence_tolerance)
+        )
         volatility_window_minutes = int(
             os.getenv("VOLATILITY_WINDOW_MINUTES", cls.volatility_window_minutes)
         )
@@ -97,11 +102,13 @@ class BotConfig:
         poll_interval_seconds = int(
             os.getenv("POLL_INTERVAL_SECONDS", cls.poll_interval_seconds)
         )
+        kline_cache_dir = os.getenv("KLINE_CACHE_DIR") or None
 
         return cls(
             telegram_token=token,
             chat_ids=chat_ids,
             price_alert_tolerance=price_alert_tolerance,
+            confluence_tolerance=confluence_tolerance,
             volatility_window_minutes=volatility_window_minutes,
             volatility_threshold=volatility_threshold,
             volatility_interval=volatility_interval,
@@ -109,4 +116,5 @@ class BotConfig:
             data_source_url=data_source_url,
             request_timeout=request_timeout,
             poll_interval_seconds=poll_interval_seconds,
+            kline_cache_dir=kline_cache_dir,
         )
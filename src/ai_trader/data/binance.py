@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 import requests
@@ -11,6 +11,35 @@ class DataSourceError(RuntimeError):
     """Raised when the remote data source fails."""
 
 
+def parse_klines(raw: Iterable[Iterable[Any]]) -> pd.DataFrame:
+    """Build a candle frame from raw Binance kline rows."""
+
+    frame = pd.DataFrame(
+        raw,
+        columns=[
+            "open_time",
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+            "close_time",
+            "quote_asset_volume",
+            "number_of_trades",
+            "taker_buy_base",
+            "taker_buy_quote",
+            "ignore",
+        ],
+    )
+    numeric_cols = ["open", "high", "low", "close", "volume"]
+    frame[numeric_cols] = frame[numeric_cols].astype(float)
+    time_cols = ["open_time", "close_time"]
+    frame[time_cols] = frame[time_cols].astype("int64")
+    frame["open_time"] = pd.to_datetime(frame["open_time"], unit="ms", utc=True)
+    frame["close_time"] = pd.to_datetime(frame["close_time"], unit="ms", utc=True)
+    return frame
+
+
 @dataclass
 class BinanceClient:
     """Minimal client for retrieving market data from Binance."""
@@ -28,46 +57,32 @@ class BinanceClient:
             )
         return response.json()
 
-    def fetch_klines(
+    def fetch_kline_rows(
         self,
         symbol: str,
         interval: str,
         limit: int = 500,
-    ) -> pd.DataFrame:
-        """Fetch historical candle data for a given symbol and timeframe."""
+    ) -> List[List[Any]]:
+        """Fetch raw kline rows as returned by the Binance API."""
 
-        raw: Iterable[Iterable[Any]] = self._request(
+        raw: List[List[Any]] = self._request(
             "/api/v3/klines",
             params={"symbol": symbol, "interval": interval, "limit": limit},
         )
 
         if not raw:
             raise DataSourceError("Received empty kline payload")
+        return raw
 
-        frame = pd.DataFrame(
-            raw,
-            columns=[
-                "open_time",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "close_time",
-                "quote_asset_volume",
-                "number_of_trades",
-                "taker_buy_base",
-                "taker_buy_quote",
-                "ignore",
-            ],
-        )
-        numeric_cols = ["open", "high", "low", "close", "volume"]
-        frame[numeric_cols] = frame[numeric_cols].astype(float)
-        time_cols = ["open_time", "close_time"]
-        frame[time_cols] = frame[time_cols].astype("int64")
-        frame["open_time"] = pd.to_datetime(frame["open_time"], unit="ms", utc=True)
-        frame["close_time"] = pd.to_datetime(frame["close_time"], unit="ms", utc=True)
-        return frame
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500,
+    ) -> pd.DataFrame:
+        """Fetch historical candle data for a given symbol and timeframe."""
+
+        return parse_klines(self.fetch_kline_rows(symbol, interval, limit))
 
     def fetch_last_price(self, symbol: str) -> float:
         payload: Dict[str, Any] = self._request(
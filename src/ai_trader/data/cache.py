@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_INTERVAL_UNITS = {
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "M": timedelta(days=31),
+}
+
+
+def interval_to_timedelta(interval: str) -> Optional[timedelta]:
+    """Convert a Binance interval such as ``4h`` to a timedelta."""
+
+    unit = _INTERVAL_UNITS.get(interval[-1:])
+    try:
+        count = int(interval[:-1])
+    except ValueError:
+        return None
+    if unit is None or count <= 0:
+        return None
+    return unit * count
+
+
+@dataclass
+class KlineCache:
+    """Stores raw kline rows on disk so a restarted bot can start warm.
+
+    Rows are kept as JSON exactly as Binance returns them, together with
+    the time they were written, and are parsed with the same code as a
+    live fetch. Entries written more than one interval ago are treated as
+    missing.
+    """
+
+    directory: str
+
+    def __post_init__(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        if not os.access(self.directory, os.W_OK):
+            raise PermissionError(f"{self.directory} is not writable")
+
+    def load(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int,
+        now: Optional[float] = None,
+    ) -> Optional[List[List[Any]]]:
+        max_age = interval_to_timedelta(interval)
+        if max_age is None:
+            return None
+
+        path = self._path(symbol, interval, limit)
+        try:
+            with open(path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Failed to read cached klines from %s: %s", path, exc)
+            return None
+
+        # The last Binance row is the still-open candle whose close time lies
+        # in the future, so freshness is judged by when the rows were written.
+        try:
+            written_at = float(payload["written_at"])
+            rows = payload["rows"]
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed cached klines in %s", path)
+            return None
+
+        if not rows:
+            return None
+
+        now = time.time() if now is None else now
+        if written_at < now - max_age.total_seconds():
+            logger.info("Ignoring stale cached klines for %s (%s)", symbol, interval)
+            return None
+        return rows
+
+    def store(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int,
+        rows: List[List[Any]],
+        now: Optional[float] = None,
+    ) -> None:
+        path = self._path(symbol, interval, limit)
+        tmp_path = f"{path}.tmp"
+        payload = {
+            "written_at": time.time() if now is None else now,
+            "rows": rows,
+        }
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Failed to write cached klines to %s: %s", path, exc)
+
+    def _path(self, symbol: str, interval: str, limit: int) -> str:
+        return os.path.join(self.directory, f"{symbol}_{interval}_{limit}.json")
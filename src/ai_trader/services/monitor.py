@@ -7,15 +7,26 @@ from typing import Dict, Iterable, List, Optional, Sequence
 import pandas as pd
 
 from ai_trader.alerting.alerts import LevelAlert, VolatilityAlert, utcnow
+from ai_trader.analysis.confluence import ConfluenceAnalyzer, ConfluenceLevel
 from ai_trader.analysis.support_resistance import PriceLevel, SupportResistanceAnalyzer
 from ai_trader.analysis.volatility import VolatilityAnalyzer
-from ai_trader.config import BotConfig, SymbolSettings, TimeframeSettings
-from ai_trader.data.binance import BinanceClient, DataSourceError
+from ai_trader.config import BotConfig, SymbolSettings
+from ai_trader.data.binance import BinanceClient, DataSourceError, parse_klines
+from ai_trader.data.cache import KlineCache
 from ai_trader.telegram.messenger import TelegramMessenger
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ActiveLevelAlert:
+    """A level zone whose last alert is still in effect."""
+
+    kind: str
+    price: float
+    direction: str
+
+
 @dataclass
 class MarketMonitor:
     config: BotConfig
@@ -23,15 +34,19 @@ class MarketMonitor:
     messenger: TelegramMessenger
     sr_analyzer: SupportResistanceAnalyzer = field(default_factory=SupportResistanceAnalyzer)
     vol_analyzer: Optional[VolatilityAnalyzer] = None
+    confluence_analyzer: ConfluenceAnalyzer = field(init=False)
+    kline_cache: Optional[KlineCache] = None
 
     def __post_init__(self) -> None:
+        self.confluence_analyzer = ConfluenceAnalyzer(self.config.confluence_tolerance)
         if self.vol_analyzer is None:
             self.vol_analyzer = VolatilityAnalyzer(
                 self.config.volatility_window_minutes, self.config.volatility_threshold
             )
         self.previous_prices: Dict[str, float] = {}
-        self.active_level_alerts: Dict[str, str] = {}
+        self.active_level_alerts: Dict[str, List[ActiveLevelAlert]] = {}
         self.last_volatility_alert: Dict[str, pd.Timestamp] = {}
+        self._warm = False
 
     def run_once(self) -> List[str]:
         alerts_to_send: List[str] = []
@@ -43,9 +58,11 @@ class MarketMonitor:
                 logger.warning("Failed to fetch price for %s: %s", pair, exc)
                 continue
 
+            levels: List[PriceLevel] = []
+            complete = True
             for timeframe in self.config.timeframes:
                 try:
-                    candles = self.data_client.fetch_klines(
+                    candles = self._fetch_level_klines(
                         pair,
                         interval=timeframe.interval,
                         limit=timeframe.lookback,
@@ -57,16 +74,18 @@ class MarketMonitor:
                         timeframe.name,
                         exc,
                     )
+                    complete = False
                     continue
 
-                levels = self.sr_analyzer.detect_levels(candles, timeframe.name)
-                level_alerts = self._evaluate_levels(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    levels=levels,
-                    price=current_price,
-                )
-                alerts_to_send.extend(level_alerts)
+                levels.extend(self.sr_analyzer.detect_levels(candles, timeframe.name))
+
+            level_alerts = self._evaluate_levels(
+                symbol=symbol,
+                levels=self.confluence_analyzer.merge(levels),
+                price=current_price,
+                complete=complete,
+            )
+            alerts_to_send.extend(level_alerts)
 
             volatility_alert = self._evaluate_volatility(symbol)
             if volatility_alert:
@@ -74,6 +93,7 @@ class MarketMonitor:
 
             self.previous_prices[pair] = current_price
 
+        self._warm = True
         return alerts_to_send
 
     def dispatch_alerts(self, alerts: Iterable[str]) -> None:
@@ -83,37 +103,87 @@ class MarketMonitor:
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.error("Failed to dispatch alert: %s", exc)
 
+    def _fetch_level_klines(self, pair: str, interval: str, limit: int) -> pd.DataFrame:
+        # The first cycle after a restart analyses recent cached history
+        # instead of waiting for every timeframe to download; later cycles
+        # refresh it. Stale entries are rejected by the cache.
+        if self.kline_cache is None:
+            return self.data_client.fetch_klines(pair, interval=interval, limit=limit)
+
+        if not self._warm:
+            cached = self.kline_cache.load(pair, interval, limit)
+            if cached is not None:
+                return parse_klines(cached)
+
+        rows = self.data_client.fetch_kline_rows(pair, interval=interval, limit=limit)
+        self.kline_cache.store(pair, interval, limit, rows)
+        return parse_klines(rows)
+
     def _evaluate_levels(
         self,
         symbol: SymbolSettings,
-        timeframe: TimeframeSettings,
-        levels: Sequence[PriceLevel],
+        levels: Sequence[ConfluenceLevel],
         price: float,
+        complete: bool = True,
     ) -> List[str]:
         previous_price = self.previous_prices.get(symbol.pair)
         tolerance = self.config.price_alert_tolerance
+        previous_active = list(self.active_level_alerts.get(symbol.pair, []))
         messages: List[str] = []
+        # Zones that are not triggered are dropped so they can alert again,
+        # and so the state never outgrows the levels currently in play. When
+        # a timeframe failed to load, its zones are missing from ``levels``,
+        # so nothing is dropped until the data is complete again.
+        still_active: List[ActiveLevelAlert] = []
 
         for level in levels:
             direction = self._level_trigger(level, price, previous_price, tolerance)
-            key = self._level_key(symbol.pair, timeframe.name, level)
-            if direction:
-                if self.active_level_alerts.get(key) == direction:
+            active = self._match_active(previous_active, level)
+            if active is not None:
+                previous_active.remove(active)
+            if not direction:
+                if active is not None and not complete:
+                    still_active.append(active)
+                continue
+            if active is not None:
+                if active.direction == direction:
+                    # Follow the merged price as touch counts shift it.
+                    active.price = level.price
+                    still_active.append(active)
                     continue
-                alert = LevelAlert(
-                    symbol=symbol.name,
-                    timeframe=timeframe.name,
-                    level=level,
-                    price=price,
-                    direction=direction,
-                    triggered_at=utcnow(),
-                )
-                messages.append(alert.format_message())
-                self.active_level_alerts[key] = direction
-            else:
-                self.active_level_alerts.pop(key, None)
+            alert = LevelAlert(
+                symbol=symbol.name,
+                level=level,
+                price=price,
+                direction=direction,
+                triggered_at=utcnow(),
+            )
+            messages.append(alert.format_message())
+            still_active.append(
+                ActiveLevelAlert(kind=level.kind, price=level.price, direction=direction)
+            )
+
+        if not complete:
+            still_active.extend(previous_active)
+        self.active_level_alerts[symbol.pair] = still_active
         return messages
 
+    def _match_active(
+        self, active: Sequence[ActiveLevelAlert], level: ConfluenceLevel
+    ) -> Optional[ActiveLevelAlert]:
+        """Find the active zone closest to ``level`` within the merge tolerance."""
+
+        tolerance = self.config.confluence_tolerance
+        candidates = [
+            item
+            for item in active
+            if item.kind == level.kind
+            and abs(item.price - level.price) <= item.price * tolerance
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda item: abs(item.price - level.price))
+
     def _evaluate_volatility(self, symbol: SymbolSettings) -> Optional[str]:
         if self.vol_analyzer is None:
             return None
@@ -145,28 +215,25 @@ class MarketMonitor:
 
     def _level_trigger(
         self,
-        level: PriceLevel,
+        level: ConfluenceLevel,
         price: float,
         previous_price: Optional[float],
         tolerance: float,
     ) -> Optional[str]:
-        threshold = level.price * tolerance
+        # A merged zone spans its member prices; touching any part of it counts,
+        # and a support/resistance only breaks past its outermost member.
+        lower = level.low - level.low * tolerance
+        upper = level.high + level.high * tolerance
         if level.kind == "support":
-            if price <= level.price - threshold:
-                if not previous_price or previous_price > level.price - threshold:
+            if price <= lower:
+                if not previous_price or previous_price > lower:
                     return "跌破"
-            elif abs(price - level.price) <= threshold:
+            elif price <= upper:
                 return "触及"
         else:
-            if price >= level.price + threshold:
-                if not previous_price or previous_price < level.price + threshold:
+            if price >= upper:
+                if not previous_price or previous_price < upper:
                     return "突破"
-            elif abs(price - level.price) <= threshold:
+            elif price >= lower:
                 return "触及"
         return None
-
-    def _level_key(
-        self, symbol: str, timeframe: str, level: PriceLevel
-    ) -> str:
-        rounded = round(level.price, 2)
-        return f"{symbol}:{timeframe}:{level.kind}:{rounded}"
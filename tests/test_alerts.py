@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from ai_trader.alerting.alerts import LevelAlert, utcnow
+from ai_trader.analysis.confluence import ConfluenceLevel
+
+
+def test_level_alert_shows_confluence():
+    level = ConfluenceLevel(
+        price=60000.0,
+        kind="support",
+        touches=7,
+        last_touched=pd.Timestamp("2024-01-01", tz="UTC"),
+        low=59980.0,
+        high=60020.0,
+        timeframes=["1d", "4h", "1h"],
+    )
+    alert = LevelAlert(
+        symbol="BTC",
+        level=level,
+        price=59990.0,
+        direction="触及",
+        triggered_at=utcnow(),
+    )
+
+    message = alert.format_message()
+
+    assert message.splitlines()[0] == "🛡️ BTC 1d/4h/1h SUPPORT 触及"
+    assert "关键位 60000.00" in message
+    assert "触碰次数: 7" in message
+    assert message.count("4h") == 1
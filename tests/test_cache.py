@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import time
+from datetime import timedelta
+
+import pytest
+
+from ai_trader.data.binance import parse_klines
+from ai_trader.data.cache import KlineCache, interval_to_timedelta
+
+
+def make_rows(last_close_ms, count=3, step_ms=3_600_000):
+    rows = []
+    for idx in range(count):
+        close_ms = last_close_ms - (count - 1 - idx) * step_ms
+        open_ms = close_ms - step_ms + 1
+        rows.append(
+            [open_ms, "100.0", "101.0", "99.0", "100.5", "10.0", close_ms,
+             "1005.0", 12, "5.0", "502.5", "0"]
+        )
+    return rows
+
+
+def test_interval_to_timedelta():
+    assert interval_to_timedelta("15m") == timedelta(minutes=15)
+    assert interval_to_timedelta("4h") == timedelta(hours=4)
+    assert interval_to_timedelta("1d") == timedelta(days=1)
+    assert interval_to_timedelta("1x") is None
+    assert interval_to_timedelta("h") is None
+
+
+def test_roundtrip_parses_like_live_fetch(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    now = time.time()
+    rows = make_rows(int(now * 1000))
+
+    cache.store("BTCUSDT", "1h", 3, rows)
+    loaded = cache.load("BTCUSDT", "1h", 3, now=now)
+
+    assert loaded == rows
+    assert parse_klines(loaded).equals(parse_klines(rows))
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_stale_entries_are_ignored(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    now = time.time()
+    cache.store("BTCUSDT", "1h", 3, make_rows(int((now - 7200) * 1000)), now=now - 7200)
+
+    assert cache.load("BTCUSDT", "1h", 3, now=now) is None
+    assert cache.load("BTCUSDT", "1h", 3, now=now - 5400) is not None
+
+
+def test_in_progress_last_candle_does_not_extend_freshness(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    written_at = time.time()
+    # Binance's last row is the open candle, closing almost a day from now.
+    open_candle_close_ms = int((written_at + 86_000) * 1000)
+    rows = make_rows(open_candle_close_ms, step_ms=86_400_000)
+    cache.store("BTCUSDT", "1d", 3, rows, now=written_at)
+
+    assert cache.load("BTCUSDT", "1d", 3, now=written_at + 43_200) == rows
+    assert cache.load("BTCUSDT", "1d", 3, now=written_at + 1.5 * 86_400) is None
+
+
+def test_lookback_is_part_of_the_key(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    now = time.time()
+    cache.store("BTCUSDT", "1h", 3, make_rows(int(now * 1000)))
+
+    assert cache.load("BTCUSDT", "1h", 500, now=now) is None
+
+
+def test_corrupt_file_is_ignored(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    (tmp_path / "BTCUSDT_1h_3.json").write_text("not json", encoding="utf-8")
+
+    assert cache.load("BTCUSDT", "1h", 3) is None
+
+
+def test_rows_without_write_time_are_ignored(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    rows = make_rows(int(time.time() * 1000))
+    (tmp_path / "BTCUSDT_1h_3.json").write_text(json.dumps(rows), encoding="utf-8")
+
+    assert cache.load("BTCUSDT", "1h", 3) is None
+
+
+def test_unusable_directory_raises(tmp_path):
+    target = tmp_path / "file"
+    target.write_text("", encoding="utf-8")
+
+    with pytest.raises(OSError):
+        KlineCache(str(target / "cache"))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from ai_trader.analysis.confluence import ConfluenceAnalyzer
+from ai_trader.analysis.support_resistance import PriceLevel
+
+
+def make_level(price, kind="support", touches=1, timeframe="1h", day=1):
+    return PriceLevel(
+        price=price,
+        kind=kind,
+        touches=touches,
+        timeframe=timeframe,
+        last_touched=pd.Timestamp(f"2024-01-{day:02d}", tz="UTC"),
+    )
+
+
+def test_merges_levels_across_timeframes():
+    analyzer = ConfluenceAnalyzer(tolerance=0.003)
+
+    merged = analyzer.merge(
+        [
+            make_level(100.0, touches=3, timeframe="1d", day=1),
+            make_level(100.2, touches=1, timeframe="4h", day=3),
+            make_level(110.0, touches=2, timeframe="1h", day=2),
+        ]
+    )
+
+    assert len(merged) == 2
+    zone = next(level for level in merged if level.price < 105)
+    assert zone.timeframes == ["1d", "4h"]
+    assert zone.touches == 4
+    assert zone.price == (100.0 * 3 + 100.2) / 4
+    assert zone.last_touched == pd.Timestamp("2024-01-03", tz="UTC")
+
+
+def test_timeframes_follow_input_order():
+    analyzer = ConfluenceAnalyzer(tolerance=0.003)
+
+    merged = analyzer.merge(
+        [
+            make_level(100.2, timeframe="1d"),
+            make_level(100.0, timeframe="4h"),
+            make_level(100.1, timeframe="1h"),
+        ]
+    )
+
+    assert [level.timeframes for level in merged] == [["1d", "4h", "1h"]]
+
+
+def test_zone_spread_stays_within_tolerance():
+    analyzer = ConfluenceAnalyzer(tolerance=0.003)
+
+    # 100.25 is within tolerance of 100.0; 100.4 is not, even though it is
+    # close to the zone's running average, so it starts a new zone.
+    merged = analyzer.merge(
+        [
+            make_level(100.0, timeframe="1d"),
+            make_level(100.25, timeframe="4h"),
+            make_level(100.4, timeframe="1h"),
+        ]
+    )
+
+    assert [level.timeframes for level in merged] == [["1d", "4h"], ["1h"]]
+    assert (merged[0].low, merged[0].high) == (100.0, 100.25)
+    for level in merged:
+        assert level.high - level.low <= level.low * analyzer.tolerance
+
+
+def test_supports_and_resistances_stay_separate():
+    analyzer = ConfluenceAnalyzer(tolerance=0.003)
+
+    merged = analyzer.merge(
+        [
+            make_level(100.0, kind="support", timeframe="1d"),
+            make_level(100.0, kind="resistance", timeframe="4h"),
+        ]
+    )
+
+    assert sorted(level.kind for level in merged) == ["resistance", "support"]
+    assert all(level.touches == 1 for level in merged)
+
+
+def test_same_timeframe_levels_are_not_merged():
+    analyzer = ConfluenceAnalyzer(tolerance=0.003)
+
+    merged = analyzer.merge(
+        [
+            make_level(100.0, touches=2, timeframe="1h"),
+            make_level(100.1, touches=2, timeframe="1h"),
+            make_level(100.2, touches=3, timeframe="1d"),
+        ]
+    )
+
+    assert [level.timeframes for level in merged] == [["1h"], ["1h", "1d"]]
+    assert [level.touches for level in merged] == [2, 5]
+
+
+def test_empty_input():
+    assert ConfluenceAnalyzer().merge([]) == []
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def run_main(env_overrides):
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("TELEGRAM_", "KLINE_"))
+    }
+    env["PYTHONPATH"] = str(SRC_DIR)
+    env.update(env_overrides)
+    return subprocess.run(
+        [sys.executable, "-m", "ai_trader"],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+
+
+def test_missing_token_exits_before_heavy_imports():
+    result = run_main({"PYTHONVERBOSE": "1"})
+
+    assert result.returncode == 1
+    assert "Invalid configuration: TELEGRAM_BOT_TOKEN is required" in result.stderr
+    assert "import 'pandas'" not in result.stderr
+    assert "import 'requests'" not in result.stderr
+
+
+def test_unusable_cache_dir_exits_cleanly(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+
+    result = run_main(
+        {
+            "TELEGRAM_BOT_TOKEN": "token",
+            "TELEGRAM_CHAT_IDS": "1",
+            "KLINE_CACHE_DIR": str(blocker / "cache"),
+        }
+    )
+
+    assert result.returncode == 1
+    assert "Invalid configuration: KLINE_CACHE_DIR" in result.stderr
+    assert "Traceback" not in result.stderr
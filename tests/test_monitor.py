@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import time
+
+import pandas as pd
+
+from ai_trader.analysis.support_resistance import PriceLevel
+from ai_trader.config import BotConfig, SymbolSettings
+from ai_trader.data.binance import DataSourceError
+from ai_trader.data.cache import KlineCache
+from ai_trader.services.monitor import MarketMonitor
+
+
+class StubClient:
+    def __init__(self) -> None:
+        self.price = 60000.0
+        self.failing: set = set()
+        self.row_requests: list = []
+
+    def fetch_last_price(self, symbol):
+        return self.price
+
+    def fetch_klines(self, symbol, interval, limit=500):
+        if interval in self.failing:
+            raise DataSourceError("unavailable")
+        return pd.DataFrame({"timeframe": [interval]})
+
+    def fetch_kline_rows(self, symbol, interval, limit=500):
+        self.row_requests.append(interval)
+        return make_rows(int(time.time() * 1000))
+
+
+def make_rows(last_close_ms):
+    return [
+        [last_close_ms - 59_999, "1", "1", "1", "1", "1", last_close_ms,
+         "1", 1, "1", "1", "0"]
+    ]
+
+
+class StubAnalyzer:
+    def __init__(self) -> None:
+        self.levels = {
+            "1d": (60000.0, 3),
+            "4h": (60050.0, 2),
+            "1h": (60080.0, 2),
+        }
+
+    def detect_levels(self, candles, timeframe):
+        price, touches = self.levels[timeframe]
+        return [
+            PriceLevel(
+                price=price,
+                kind="support",
+                touches=touches,
+                timeframe=timeframe,
+                last_touched=pd.Timestamp("2024-01-01", tz="UTC"),
+            )
+        ]
+
+
+class StubVolatility:
+    def detect(self, symbol, timeframe, candles):
+        return None
+
+
+def make_monitor(kline_cache=None):
+    config = BotConfig(
+        telegram_token="token", chat_ids=[1], symbols=[SymbolSettings("BTC")]
+    )
+    client = StubClient()
+    analyzer = StubAnalyzer()
+    monitor = MarketMonitor(
+        config=config,
+        data_client=client,
+        messenger=None,
+        sr_analyzer=analyzer,
+        vol_analyzer=StubVolatility(),
+        kline_cache=kline_cache,
+    )
+    return monitor, client, analyzer
+
+
+def test_one_alert_per_confluence_zone():
+    monitor, _, _ = make_monitor()
+
+    alerts = monitor.run_once()
+
+    assert len(alerts) == 1
+    assert "1d/4h/1h" in alerts[0]
+
+
+def test_zone_alert_survives_touch_and_member_changes():
+    monitor, client, analyzer = make_monitor()
+    assert len(monitor.run_once()) == 1
+
+    analyzer.levels["1h"] = (60080.0, 5)
+    assert monitor.run_once() == []
+
+    client.failing = {"1d"}
+    assert monitor.run_once() == []
+
+    client.failing = set()
+    assert monitor.run_once() == []
+
+
+def test_untriggered_zones_are_pruned():
+    monitor, client, _ = make_monitor()
+    monitor.run_once()
+    assert len(monitor.active_level_alerts["BTCUSDT"]) == 1
+
+    client.price = 65000.0
+    monitor.run_once()
+    assert monitor.active_level_alerts["BTCUSDT"] == []
+
+    client.price = 60000.0
+    assert len(monitor.run_once()) == 1
+
+
+def test_first_cycle_uses_fresh_cache(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    now_ms = int(time.time() * 1000)
+    for interval in ("1d", "4h", "1h"):
+        cache.store("BTCUSDT", interval, 500, make_rows(now_ms))
+    monitor, client, _ = make_monitor(kline_cache=cache)
+
+    assert len(monitor.run_once()) == 1
+    assert client.row_requests == []
+
+    monitor.run_once()
+    assert client.row_requests == ["1d", "4h", "1h"]
+
+
+def test_stale_cache_falls_back_to_live_fetch(tmp_path):
+    cache = KlineCache(str(tmp_path))
+    written_at = time.time() - 3 * 86400
+    for interval in ("1d", "4h", "1h"):
+        cache.store(
+            "BTCUSDT", interval, 500, make_rows(int(written_at * 1000)), now=written_at
+        )
+    monitor, client, _ = make_monitor(kline_cache=cache)
+
+    monitor.run_once()
+
+    assert client.row_requests == ["1d", "4h", "1h"]
+    assert cache.load("BTCUSDT", "1d", 500) is not None
+
+
+def test_touch_near_light_member_still_alerts():
+    monitor, client, analyzer = make_monitor()
+    analyzer.levels = {"1d": (100.0, 10), "4h": (90.0, 2), "1h": (100.28, 2)}
+    client.price = 100.28
+
+    alerts = monitor.run_once()
+
+    assert len(alerts) == 1
+    assert alerts[0].startswith("🛡️ BTC 1d/1h SUPPORT 触及")
+
+
+def test_break_below_zone_uses_lowest_member():
+    monitor, client, analyzer = make_monitor()
+    analyzer.levels = {"1d": (100.0, 10), "4h": (90.0, 2), "1h": (100.28, 2)}
+    client.price = 101.0
+    assert monitor.run_once() == []
+
+    client.price = 99.7
+    alerts = monitor.run_once()
+
+    assert len(alerts) == 1
+    assert "跌破" in alerts[0]
+
+
+def test_single_timeframe_zone_keeps_state_through_fetch_failure():
+    monitor, client, analyzer = make_monitor()
+    analyzer.levels = {"1d": (60000.0, 3), "4h": (55000.0, 2), "1h": (50000.0, 2)}
+    assert len(monitor.run_once()) == 1
+
+    client.failing = {"1d"}
+    assert monitor.run_once() == []
+    assert len(monitor.active_level_alerts["BTCUSDT"]) == 1
+
+    client.failing = set()
+    assert monitor.run_once() == []